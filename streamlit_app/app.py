@@ -1,12 +1,24 @@
 import os
+import json
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from supabase import create_client
-from sqlalchemy import create_engine, text
+from sqlalchemy import String, bindparam, create_engine, text
+from sqlalchemy.dialects.postgresql import ARRAY
+
+try:
+    import connectorx as cx
+except ImportError:  # optional: large queries fall back to pd.read_sql
+    cx = None
 
 # =============================================================================
 # 1. CONFIGURATION - Load Environment Variables
@@ -60,34 +72,142 @@ config = load_config()
 def get_db_engine():
     """Create and cache database engine"""
     try:
-        engine = create_engine(
+        # No test query here: pool_pre_ping already checks each connection on
+        # checkout, and connection errors surface from the first real query
+        return create_engine(
             config["DATABASE_URL"],
             pool_pre_ping=True,
+            # Every session's query workers and script thread can hold connections at
+            # once, so keep five warm and let concurrent sessions overflow
             pool_size=5,
-            max_overflow=10
+            max_overflow=10,
+            pool_recycle=1800
         )
-        # Test connection
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-        return engine
     except Exception as e:
         st.error(f"❌ Database connection failed: {e}")
         st.stop()
 
-engine = get_db_engine()
+def get_query_executor():
+    """Get this session's thread pool for running queries alongside the Groq call"""
+    # Per session rather than st.cache_resource, so one user's queries never queue behind another's
+    if "query_executor" not in st.session_state:
+        st.session_state["query_executor"] = ThreadPoolExecutor(max_workers=3, thread_name_prefix="talent-query")
+    return st.session_state["query_executor"]
+
+def query_result(future):
+    """Wait for a submitted query, stopping the run with an error if it failed"""
+    # Worker threads have no ScriptRunContext, so run_query's own st.error never renders
+    try:
+        return future.result()
+    except Exception as e:
+        st.error(f"❌ Query execution error: {e}")
+        st.stop()
+
+query_executor = get_query_executor()
 
 # =============================================================================
 # 3. SUPABASE CLIENT
 # =============================================================================
 
-supabase = create_client(config["SUPABASE_URL"], config["SUPABASE_KEY"])
+@st.cache_resource
+def get_supabase_client():
+    """Create and cache Supabase client"""
+    return create_client(config["SUPABASE_URL"], config["SUPABASE_KEY"])
+
+supabase = get_supabase_client()
 
 # =============================================================================
-# 4. UTILITY FUNCTIONS
+# 4. GROQ HTTP SESSION
 # =============================================================================
 
+@st.cache_resource
+def get_groq_session():
+    """Create and cache a pooled HTTP session for Groq API calls"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            # POST is not retried by default; completions are safe to resend
+            allowed_methods=frozenset({"POST"})
+        )
+    )
+    session.mount("https://", adapter)
+    session.headers.update({
+        "Authorization": f"Bearer {config['GROQ_API_KEY']}",
+        "Content-Type": "application/json"
+    })
+    return session
+
+groq_session = get_groq_session()
+
+# Number of streamed completion chunks between job profile re-renders
+STREAM_RENDER_EVERY = 8
+
+# Seconds a generated job profile is reused, across all sessions
+JOB_PROFILE_TTL_SECONDS = 24 * 3600
+
+@st.cache_resource
+def get_job_profile_cache():
+    """Create and cache the store of generated job profiles shared by all sessions"""
+    return {}
+
+def get_stored_job_profile(key: tuple):
+    """Return the stored job profile for the inputs, or None if missing or expired"""
+    stored = get_job_profile_cache().get(key)
+    if stored is not None and time.time() - stored[0] < JOB_PROFILE_TTL_SECONDS:
+        return stored[1]
+    return None
+
+def store_job_profile(key: tuple, profile_text: str):
+    """Store a generated job profile and evict the expired ones"""
+    job_profiles = get_job_profile_cache()
+    now = time.time()
+    for expired_key in [k for k, (stored_at, _) in list(job_profiles.items()) if now - stored_at >= JOB_PROFILE_TTL_SECONDS]:
+        job_profiles.pop(expired_key, None)
+    job_profiles[key] = (now, profile_text)
+
+# =============================================================================
+# 5. UTILITY FUNCTIONS
+# =============================================================================
+
+# Compact dtypes for the talent match query results: categories for the
+# repeated labels, float32 for the scores
+RANKED_EMPLOYEES_DTYPES = {
+    "position": "category",
+    "final_match_rate": "float32"
+}
+# The ranked result also carries the pool-wide median and count for the Insights
+# tab; only these columns are shown in the ranking table
+RANKED_EMPLOYEES_DISPLAY_COLUMNS = ["Rank", "employee_id", "fullname", "position", "final_match_rate"]
+CANDIDATE_DETAIL_DTYPES = {
+    "tgv_name": "category",
+    "tv_name": "category",
+    "baseline_score": "float32",
+    "user_score": "float32",
+    "tv_match_rate": "float32",
+    "tgv_match_rate": "float32"
+}
+TGV_SUMMARY_DTYPES = {
+    "tgv_name": "category",
+    "tgv_match_rate": "float32"
+}
+
+# Equal-width bins of the match rate histogram over the fixed 0-100 scale
+MATCH_HISTOGRAM_BINS = 15
+
+# Rows fetched per round trip when streaming query results
+READ_CHUNK_SIZE = 10_000
+
+# Set USE_CONNECTORX=0 to send large queries through pd.read_sql even when connectorx is installed
+USE_CONNECTORX = cx is not None and os.getenv("USE_CONNECTORX", "1") != "0"
+
+@st.cache_resource
 def load_sql(filename):
-    """Loads a SQL query from the queries directory."""
+    """Loads (and caches) a SQL query from the queries directory."""
     try:
         # Determine the absolute path to the directory where app.py resides
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -105,22 +225,168 @@ def load_sql(filename):
         st.error(f"❌ Error loading SQL file: {e}")
         st.stop()
 
-def run_query(sql: str, params: dict = None) -> pd.DataFrame:
+def load_talent_match_sql(filename):
+    """Loads a SQL query that wraps the talent_match.sql result set."""
+    talent_match = load_sql("talent_match.sql").strip().rstrip(";")
+    return load_sql(filename).replace("{talent_match}", talent_match)
+
+def shape_frame(df: pd.DataFrame, columns: list = None, dtypes: dict = None) -> pd.DataFrame:
+    """Project a query result to the needed columns and cast them to compact dtypes"""
+    if columns is not None:
+        df = df[columns]
+    if dtypes:
+        df = df.astype(dtypes)
+    return df
+
+def build_statement(sql: str, params: dict = None):
+    """Build a text() statement, typing list parameters as a single text[] bind"""
+    stmt = text(sql)
+    arrays = [
+        bindparam(name, type_=ARRAY(String))
+        for name, value in (params or {}).items()
+        if isinstance(value, (list, tuple))
+    ]
+    return stmt.bindparams(*arrays) if arrays else stmt
+
+def run_query(sql: str, params: dict = None, columns: list = None, dtypes: dict = None, stream: bool = False) -> pd.DataFrame:
     """Execute parameterized SQL query and return DataFrame"""
+    stmt = build_statement(sql, params) if params else sql
+    
+    # Arrow-backed columns keep strings in contiguous buffers instead of one Python
+    # object per cell; shape_frame then keeps only `columns` and applies `dtypes`
     try:
-        with engine.connect() as conn:
-            if params:
-                stmt = text(sql)
-                df = pd.read_sql(stmt, conn, params=params)
-            else:
-                df = pd.read_sql(sql, conn)
-        return df
+        if not stream:
+            with get_db_engine().connect() as conn:
+                df = pd.read_sql(stmt, conn, params=params, dtype_backend="pyarrow")
+            return shape_frame(df, columns, dtypes)
+        
+        # Category dtypes are applied after the concat: chunks carry different category
+        # sets, and concatenating those would fall back to object columns
+        chunk_dtypes = {col: dtype for col, dtype in (dtypes or {}).items() if dtype != "category"}
+        
+        # Server-side cursor: rows arrive READ_CHUNK_SIZE at a time and each chunk is
+        # narrowed before the next is fetched, so the full raw result is never held at once
+        with get_db_engine().connect().execution_options(stream_results=True) as conn:
+            chunks = pd.read_sql(stmt, conn, params=params, chunksize=READ_CHUNK_SIZE, dtype_backend="pyarrow")
+            df = pd.concat(
+                [shape_frame(chunk, columns, chunk_dtypes) for chunk in chunks],
+                ignore_index=True
+            )
+        return shape_frame(df, dtypes=dtypes)
     except Exception as e:
         st.error(f"❌ Query execution error: {e}")
         raise
 
+def render_sql(sql: str, params: dict) -> str:
+    """Inline bound parameters into SQL text with the Postgres dialect's literal rendering"""
+    # Compiled against the dialect alone, so no pooled connection is checked out
+    compiled = build_statement(sql, params).bindparams(**params).compile(
+        dialect=get_db_engine().dialect,
+        compile_kwargs={"literal_binds": True, "render_postcompile": True}
+    )
+    return str(compiled)
+
+def run_columnar_query(sql: str, params: dict, columns: list = None, dtypes: dict = None) -> pd.DataFrame:
+    """Execute a large parameterized SQL query through connectorx's Arrow transfer"""
+    if not USE_CONNECTORX:
+        # Only the ranking takes this path, so stream its rows through a server-side cursor
+        return run_query(sql, params, columns, dtypes, stream=True)
+    
+    try:
+        # connectorx expects a plain postgresql:// URL without the SQLAlchemy driver suffix
+        db_url = get_db_engine().url.set(drivername="postgresql").render_as_string(hide_password=False)
+        # connectorx cannot bind parameters, and it wraps the query for its own metadata
+        # queries, so inline the parameters and drop a trailing semicolon
+        table = cx.read_sql(db_url, render_sql(sql.strip().rstrip(";"), params), return_type="arrow")
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        return shape_frame(df, columns, dtypes)
+    except Exception as e:
+        st.error(f"❌ Query execution error: {e}")
+        raise
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_employee_ids_for_role(role_name: str) -> list:
+    """Fetch (and cache) employee IDs whose position matches the role name"""
+    # match_benchmark_employees is defined in migrations/match_benchmark_employees.sql
+    sql_filter = "SELECT employee_id FROM match_benchmark_employees(:role_name)"
+    
+    emp_df = run_query(sql_filter, params={"role_name": role_name})
+    return emp_df["employee_id"].tolist()
+
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def run_query_cached(
+    sql: str,
+    role_name: str,
+    job_level: str,
+    role_purpose: str,
+    benchmark_ids: tuple,
+    employee_id: str = None,
+    columnar: bool = False,
+    columns: list = None,
+    dtypes: dict = None
+) -> pd.DataFrame:
+    """Execute (and cache) a query parameterized by the job vacancy inputs"""
+    params = {
+        "role_name": role_name,
+        "job_level": job_level,
+        "role_purpose": role_purpose,
+        "benchmark_employee_ids": list(benchmark_ids)
+    }
+    if employee_id is not None:
+        params["employee_id"] = employee_id
+    if columnar:
+        return run_columnar_query(sql, params, columns, dtypes)
+    return run_query(sql, params, columns, dtypes)
+
+def get_ranked_employees(role_name: str, job_level: str, role_purpose: str, benchmark_ids: tuple) -> pd.DataFrame:
+    """Fetch one ranked row per candidate, deduplicated and ordered in the database"""
+    return run_query_cached(
+        load_talent_match_sql("ranked_employees.sql"), role_name, job_level, role_purpose, benchmark_ids,
+        columnar=True, dtypes=RANKED_EMPLOYEES_DTYPES
+    )
+
+def get_candidate_details(role_name: str, job_level: str, role_purpose: str, benchmark_ids: tuple, employee_id: str) -> pd.DataFrame:
+    """Fetch the per-TV match breakdown of a single candidate"""
+    return run_query_cached(
+        load_talent_match_sql("candidate_detail.sql"), role_name, job_level, role_purpose, benchmark_ids,
+        employee_id=employee_id, dtypes=CANDIDATE_DETAIL_DTYPES
+    )
+
+def get_top_candidate_details(role_name: str, job_level: str, role_purpose: str, benchmark_ids: tuple) -> pd.DataFrame:
+    """Fetch the per-TV match breakdown of the top-ranked candidate"""
+    return run_query_cached(
+        load_talent_match_sql("top_candidate_detail.sql"), role_name, job_level, role_purpose, benchmark_ids,
+        dtypes=CANDIDATE_DETAIL_DTYPES
+    )
+
+def get_tgv_summary(role_name: str, job_level: str, role_purpose: str, benchmark_ids: tuple) -> pd.DataFrame:
+    """Fetch average TGV match rates aggregated in the database"""
+    return run_query_cached(
+        load_talent_match_sql("tgv_summary.sql"), role_name, job_level, role_purpose, benchmark_ids,
+        dtypes=TGV_SUMMARY_DTYPES
+    )
+
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def get_match_histogram(role_name: str, job_level: str, role_purpose: str, benchmark_ids: tuple) -> tuple:
+    """Bin (and cache) the ranked candidates' final match rates over 0-100"""
+    # Keyed on the inputs rather than the frame, and reads the already cached ranking
+    ranked_employees = get_ranked_employees(role_name, job_level, role_purpose, benchmark_ids)
+    # Clipped so rates outside 0-100 are counted in the end bins
+    rates = np.clip(ranked_employees["final_match_rate"].to_numpy(dtype="float64"), 0, 100)
+    return np.histogram(rates, bins=np.linspace(0, 100, MATCH_HISTOGRAM_BINS + 1))
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def get_radar_data(details: pd.DataFrame) -> pd.DataFrame:
+    """Compute (and cache) a candidate's average TV match rate per TGV for the radar chart"""
+    return (
+        details
+        .groupby("tgv_name", observed=True)["tv_match_rate"]
+        .mean()
+        .reset_index()
+    )
+
 def generate_job_profile(role_name: str, job_level: str, role_purpose: str) -> str:
-    """Generate job profile using Groq API"""
+    """Generate job profile using Groq API, rendering tokens as they stream in"""
     prompt = f"""Generate an actionable job profile for:
 
 Role: {role_name}
@@ -134,32 +400,104 @@ Include:
 
 Format the response in clear markdown."""
 
-    headers = {
-        "Authorization": f"Bearer {config['GROQ_API_KEY']}",
-        "Content-Type": "application/json"
-    }
-    
     data = {
         "model": "llama-3.1-8b-instant",
         "messages": [{"role": "user", "content": prompt}],
-        "temperature": 0.3
+        "temperature": 0.3,
+        "stream": True
     }
     
+    placeholder = st.empty()
+    
     try:
-        response = requests.post(
+        with groq_session.post(
             "https://api.groq.com/openai/v1/chat/completions",
-            headers=headers,
             json=data,
-            timeout=30
-        )
-        response.raise_for_status()
-        return response.json()["choices"][0]["message"]["content"]
-    except Exception as e:
-        st.error(f"❌ Groq API error: {e}")
-        return "Error generating job profile. Please try again."
+            timeout=30,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            
+            # Server-sent events: one "data: {...}" line per chunk, then "data: [DONE]"
+            profile_text = ""
+            chunk_count = 0
+            for line in response.iter_lines():
+                if not line.startswith(b"data: "):
+                    continue
+                payload = line[len(b"data: "):]
+                if payload == b"[DONE]":
+                    break
+                
+                delta = json.loads(payload)["choices"][0]["delta"]
+                profile_text += delta.get("content") or ""
+                chunk_count += 1
+                
+                # Re-render every few chunks rather than once per token
+                if chunk_count % STREAM_RENDER_EVERY == 0:
+                    placeholder.markdown(profile_text)
+        
+        placeholder.markdown(profile_text)
+        return profile_text
+    except Exception:
+        # Drop any partial output; the caller reports the error
+        placeholder.empty()
+        raise
+
+@st.fragment
+def render_talent_ranking(
+    ranked_employees: pd.DataFrame,
+    top_details: pd.DataFrame,
+    role_name: str,
+    job_level: str,
+    role_purpose: str,
+    benchmark_ids: tuple
+):
+    """Render the ranked candidate list and the candidate detail view"""
+    # Only the visible rows are sent to the browser
+    top_n = st.number_input(
+        "Show top candidates",
+        min_value=10,
+        max_value=1000,
+        value=100,
+        step=10
+    )
+    
+    st.dataframe(
+        ranked_employees.head(top_n)[RANKED_EMPLOYEES_DISPLAY_COLUMNS],
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    # Employee detail view
+    st.divider()
+    st.subheader("Candidate Details")
+    
+    # Build the option labels once instead of masking the frame per option
+    id_to_label = {
+        emp_id: f"{emp_id} — {fullname}"
+        for emp_id, fullname in zip(ranked_employees["employee_id"], ranked_employees["fullname"])
+    }
+    
+    selected_emp = st.selectbox(
+        "Select a candidate to view detailed breakdown",
+        ranked_employees["employee_id"],
+        format_func=id_to_label.get
+    )
+    
+    # The default selection is the top candidate, whose rows are already here
+    if selected_emp == ranked_employees["employee_id"].iloc[0]:
+        emp_rows = top_details
+    else:
+        emp_rows = get_candidate_details(role_name, job_level, role_purpose, benchmark_ids, selected_emp)
+    
+    st.dataframe(
+        emp_rows[["tgv_name", "tv_name", "baseline_score", "user_score", "tv_match_rate"]],
+        use_container_width=True,
+        hide_index=True
+    )
 
 # =============================================================================
-# 5. STREAMLIT UI
+# 6. STREAMLIT UI
 # =============================================================================
 
 st.set_page_config(page_title="Talent Match Dashboard", layout="wide")
@@ -169,39 +507,32 @@ st.title("🎯 Talent Match Dashboard")
 with st.sidebar:
     st.header("Job Vacancy Inputs")
     
-    role_name = st.text_input("Role Name", value="", placeholder="e.g., Senior Data Analyst")
-    job_level = st.text_input("Job Level", value="", placeholder="e.g., Senior")
-    role_purpose = st.text_area(
-        "Role Purpose", 
-        value="",
-        placeholder="Describe the main purpose this role...",
-        height=150
-    )
+    # Inputs inside a form only reach the script on submit, so editing them does
+    # not rerun the employee lookup (or the analysis) for every change
+    with st.form("job_vacancy_form"):
+        role_name = st.text_input("Role Name", value="", placeholder="e.g., Senior Data Analyst")
+        job_level = st.text_input("Job Level", value="", placeholder="e.g., Senior")
+        role_purpose = st.text_area(
+            "Role Purpose", 
+            value="",
+            placeholder="Describe the main purpose this role...",
+            height=150
+        )
+        st.form_submit_button("Load Benchmark Employees")
     
     st.divider()
     
     # Load employee IDs only
     if role_name:
         # Load employee IDs filtered by role_name
+        emp_ids = []
         try:
-            sql_filter = """
-                SELECT 
-                    e.employee_id
-                FROM 
-                    employees e
-                JOIN
-                    dim_positions dp ON e.position_id = dp.position_id
-                WHERE 
-                    dp.name ILIKE :role_pattern
-                ORDER BY e.employee_id
-            """
-            
-            # Pass the role name with wildcards for matching
-            params_filter = {"role_pattern": f"%{role_name}%"}
-
-            # Assuming run_query is correctly defined and handles parameters
-            emp_df = run_query(sql_filter, params=params_filter)
-            emp_ids = emp_df["employee_id"].tolist()
+            # Keep the list for this role in the session so widget reruns skip the
+            # lookup entirely, even after the function cache entry expires
+            emp_ids_key = f"emp_ids::{role_name}"
+            if emp_ids_key not in st.session_state:
+                st.session_state[emp_ids_key] = fetch_employee_ids_for_role(role_name)
+            emp_ids = st.session_state[emp_ids_key]
             
             # Use the filtered list for the multiselect
             benchmark_ids = st.multiselect(
@@ -220,19 +551,39 @@ with st.sidebar:
             
     else:
         # If no role name is entered, display a prompt and an empty list
-        st.info("Enter a **Role Name** above to load matching benchmark employees.")
+        st.info("Enter a **Role Name** above and click **Load Benchmark Employees** to load matching benchmark employees.")
         benchmark_ids = []
         
 
 # =============================================================================
-# 6. MAIN ANALYSIS - Conditional Execution
+# 7. MAIN ANALYSIS - Conditional Execution
 # =============================================================================
 
 # Check if the essential parameters are filled before running the analysis.
 # We require a Role Name and at least one Benchmark Employee ID.
 if role_name and benchmark_ids:
     
-    job_vacancy_id = str(uuid.uuid4())
+    # Sorted tuple so the same benchmark selection always hits the same cache entry
+    benchmark_key = tuple(sorted(benchmark_ids))
+    
+    # The queries and the Groq call are independent I/O, so start the queries
+    # now and let them run while the job profile streams in Tab 1
+    ranked_employees_future = query_executor.submit(
+        get_ranked_employees, role_name, job_level, role_purpose, benchmark_key
+    )
+    tgv_summary_future = query_executor.submit(
+        get_tgv_summary, role_name, job_level, role_purpose, benchmark_key
+    )
+    top_details_future = query_executor.submit(
+        get_top_candidate_details, role_name, job_level, role_purpose, benchmark_key
+    )
+    
+    # Keep one Job Vacancy ID per set of inputs instead of a new one on every rerun
+    vacancy_inputs = (role_name, job_level, role_purpose, benchmark_key)
+    if st.session_state.get("job_vacancy_inputs") != vacancy_inputs:
+        st.session_state["job_vacancy_inputs"] = vacancy_inputs
+        st.session_state["job_vacancy_id"] = str(uuid.uuid4())
+    job_vacancy_id = st.session_state["job_vacancy_id"]
     st.success(f"✅ Job Vacancy ID: `{job_vacancy_id}`")
 
     # Tab layout for better organization
@@ -242,92 +593,77 @@ if role_name and benchmark_ids:
     # Content for Tab 1 (AI Job Profile)
     # -------------------------------------------------------------------------
     with tab1:
-        with st.spinner("Generating AI job profile..."):
-            # Ensure generate_job_profile is correctly defined elsewhere and potentially cached
-            profile_text = generate_job_profile(role_name, job_level, role_purpose)
+        # A stored profile is rendered once; only a miss calls Groq and streams into the tab
+        try:
+            profile_key = (role_name, job_level, role_purpose)
+            profile_text = get_stored_job_profile(profile_key)
+            if profile_text is not None:
+                st.markdown(profile_text)
+            else:
+                with st.spinner("Generating AI job profile..."):
+                    profile_text = generate_job_profile(role_name, job_level, role_purpose)
+                store_job_profile(profile_key, profile_text)
+        except Exception as e:
+            st.error(f"❌ Groq API error: {e}")
+            profile_text = "Error generating job profile. Please try again."
             st.markdown(profile_text)
 
     # -------------------------------------------------------------------------
     # Content for Tab 2 (Talent Ranking)
     # -------------------------------------------------------------------------
     with tab2:
-        # Load and execute SQL
-        sql = load_sql("talent_match.sql")
-        params = {
-            "role_name": role_name,
-            "job_level": job_level,
-            "role_purpose": role_purpose,
-            "benchmark_employee_ids": benchmark_ids
-        }
-        
         with st.spinner("Running talent match analysis..."):
-            df = run_query(sql, params)
+            ranked_employees = query_result(ranked_employees_future)
         
-        if df.empty:
+        if ranked_employees.empty:
             st.warning("⚠️ No results found. Please check your inputs and ensure the database has relevant data.")
         
         else:
-            # Ranked talent list
+            # Ranked talent list (one row per candidate, ranked in SQL)
             st.subheader("Top Matching Candidates")
             
-            ranked_employees = (
-                df[["employee_id", "fullname", "position", "final_match_rate"]]
-                .drop_duplicates(subset=["employee_id"])
-                .sort_values("final_match_rate", ascending=False)
-                .reset_index(drop=True)
-            )
-            
-            # Add rank column
-            ranked_employees.insert(0, "Rank", range(1, len(ranked_employees) + 1))
-            
-            st.dataframe(
-                ranked_employees,
-                use_container_width=True,
-                hide_index=True
-            )
-            
-            # Employee detail view
-            st.divider()
-            st.subheader("Candidate Details")
+            # Top-ranked row, read once and reused by the Visualizations and Insights tabs
+            top_row = ranked_employees.iloc[0]
             
-            selected_emp = st.selectbox(
-                "Select a candidate to view detailed breakdown",
-                ranked_employees["employee_id"],
-                format_func=lambda x: f"{x} — {ranked_employees[ranked_employees['employee_id']==x]['fullname'].values[0]}"
-            )
+            # Fetched outside the fragment so the detail view and the radar chart share it
+            top_details = query_result(top_details_future)
             
-            emp_rows = df[df["employee_id"] == selected_emp]
-            
-            st.dataframe(
-                emp_rows[["tgv_name", "tv_name", "baseline_score", "user_score", "tv_match_rate"]],
-                use_container_width=True,
-                hide_index=True
-            )
+            # The row count and candidate selectors rerun only this fragment
+            render_talent_ranking(ranked_employees, top_details, role_name, job_level, role_purpose, benchmark_key)
 
     # -------------------------------------------------------------------------
     # Content for Tab 3 (Visualizations)
     # -------------------------------------------------------------------------
     with tab3:
         if 'ranked_employees' in locals() and not ranked_employees.empty: 
-            st.subheader("Match Rate Distribution")
-            fig_hist = px.histogram(
-                ranked_employees,
-                x="final_match_rate",
-                nbins=15,
+            # Lay the tab out up front, then fill each chart slot once every figure is built
+            with st.container():
+                st.subheader("Match Rate Distribution")
+                hist_ph = st.empty()
+                
+                st.divider()
+                
+                st.subheader("Average TGV Match Rates")
+                tgv_ph = st.empty()
+                
+                st.divider()
+                
+                st.subheader("Top Candidate Profile (Radar Chart)")
+                radar_ph = st.empty()
+            
+            # Pre-binned, so the figure carries 15 bars, not every candidate's score
+            counts, edges = get_match_histogram(role_name, job_level, role_purpose, benchmark_key)
+            centers = 0.5 * (edges[:-1] + edges[1:])
+            fig_hist = px.bar(
+                x=centers,
+                y=counts,
                 title="Distribution of Final Match Rates",
-                labels={"final_match_rate": "Match Rate (%)"}
+                labels={"x": "Match Rate (%)", "y": "count"}
             )
-            st.plotly_chart(fig_hist, use_container_width=True)
+            fig_hist.update_traces(width=np.diff(edges))
+            fig_hist.update_layout(bargap=0)
             
-            st.divider()
-            
-            st.subheader("Average TGV Match Rates")
-            tgv_summary = (
-                df.groupby("tgv_name")["tgv_match_rate"]
-                .mean()
-                .reset_index()
-                .sort_values("tgv_match_rate", ascending=False)
-            )
+            tgv_summary = query_result(tgv_summary_future)
             fig_tgv = px.bar(
                 tgv_summary,
                 x="tgv_name",
@@ -335,30 +671,26 @@ if role_name and benchmark_ids:
                 title="Average Match Rate by TGV Category",
                 labels={"tgv_name": "TGV Category", "tgv_match_rate": "Match Rate (%)"}
             )
-            st.plotly_chart(fig_tgv, use_container_width=True)
             
-            st.divider()
+            emp_tgv = get_radar_data(top_details)
             
-            st.subheader("Top Candidate Profile (Radar Chart)")
-            top_emp = ranked_employees.iloc[0]["employee_id"]
-            emp_tgv = (
-                df[df["employee_id"] == top_emp]
-                .groupby("tgv_name")["tv_match_rate"]
-                .mean()
-                .reset_index()
-            )
-            
-            categories = emp_tgv["tgv_name"].tolist()
-            values = emp_tgv["tv_match_rate"].tolist()
+            # Close the polygon by repeating the first point, without building Python lists
+            categories = emp_tgv["tgv_name"].to_numpy()
+            values = emp_tgv["tv_match_rate"].to_numpy()
             
             fig_radar = px.line_polar(
-                r=values + [values[0]],
-                theta=categories + [categories[0]],
+                r=np.concatenate([values, values[:1]]),
+                theta=np.concatenate([categories, categories[:1]]),
                 line_close=True,
-                title=f"Competency Profile: {ranked_employees.iloc[0]['fullname']}"
+                title=f"Competency Profile: {top_row['fullname']}"
             )
             fig_radar.update_traces(fill='toself')
-            st.plotly_chart(fig_radar, use_container_width=True)
+            
+            # Summary charts gain nothing from hover/zoom, so skip plotly's interactive layer
+            static_config = {"responsive": True, "staticPlot": True, "displayModeBar": False}
+            hist_ph.plotly_chart(fig_hist, use_container_width=True, config=static_config)
+            tgv_ph.plotly_chart(fig_tgv, use_container_width=True, config=static_config)
+            radar_ph.plotly_chart(fig_radar, use_container_width=True, config={"responsive": True})
         else:
             st.warning("Analysis results needed for visualizations.")
 
@@ -368,35 +700,40 @@ if role_name and benchmark_ids:
     with tab4:
         # Same check as in Tab 3
         if 'ranked_employees' in locals() and not ranked_employees.empty:
+            # The top-ranked row also carries the pool's median and count from the
+            # ranking query, so no client-side sort or median and no extra query
             col1, col2, col3 = st.columns(3)
             
             with col1:
                 st.metric(
                     "Top Candidate",
-                    ranked_employees.iloc[0]['fullname'],
-                    f"{ranked_employees.iloc[0]['final_match_rate']:.1f}%"
+                    top_row['fullname'],
+                    f"{top_row['final_match_rate']:.1f}%"
                 )
             
             with col2:
                 st.metric(
                     "Median Match Rate",
-                    f"{ranked_employees['final_match_rate'].median():.1f}%"
+                    f"{top_row['median_match_rate']:.1f}%"
                 )
             
             with col3:
                 st.metric(
                     "Total Candidates Analyzed",
-                    len(ranked_employees)
+                    int(top_row['total_candidates'])
                 )
             
             st.divider()
             
             st.subheader("Key Findings")
             
+            # One markdown element for the whole list instead of one per row
             top_3 = ranked_employees.head(3)
-            st.markdown("**Top 3 Candidates:**")
-            for idx, row in top_3.iterrows():
-                st.markdown(f"{row['Rank']}. **{row['fullname']}** ({row['position']}) — {row['final_match_rate']:.1f}% match")
+            top_3_lines = [
+                f"{row.Rank}. **{row.fullname}** ({row.position}) — {row.final_match_rate:.1f}% match"
+                for row in top_3.itertuples(index=False)
+            ]
+            st.markdown("**Top 3 Candidates:**\n\n" + "\n".join(top_3_lines))
             
             st.markdown("---")
             
@@ -0,0 +1,16 @@
+-- migrations/indexes.sql
+-- Supporting indexes for the joins in queries/talent_match.sql.
+--
+-- Check the current plan first, e.g. with EXPLAIN (ANALYZE, BUFFERS) on the
+-- rendered talent_match.sql, to confirm the sequential scans these replace.
+--
+-- CREATE INDEX CONCURRENTLY builds without blocking writes but cannot run inside
+-- a transaction block, so run this file with psql (autocommit) rather than as a
+-- single multi-statement query.
+
+-- consolidated_scores joins profiles_psych to candidate_pool once per TV (six times)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_profiles_psych_employee_id
+    ON profiles_psych (employee_id);
+
+-- employees needs no index here: the final SELECT looks employees up by
+-- employee_id, which the employees primary key index already serves
@@ -0,0 +1,31 @@
+-- migrations/match_benchmark_employees.sql
+-- Benchmark employee lookup used by the app sidebar.
+-- Run once against the database (e.g. in the Supabase SQL editor).
+
+-- Trigram index so the case-insensitive substring match on position name
+-- can use an index scan instead of scanning every position
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ix_dim_positions_name_trgm
+    ON dim_positions USING gin (name gin_trgm_ops);
+
+-- Join key from employees to dim_positions
+CREATE INDEX IF NOT EXISTS ix_employees_position_id
+    ON employees (position_id);
+
+-- Returns only the employee IDs whose position matches the role name
+CREATE OR REPLACE FUNCTION match_benchmark_employees(role_name text)
+RETURNS TABLE (employee_id employees.employee_id%TYPE)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        e.employee_id
+    FROM
+        employees e
+    JOIN
+        dim_positions dp ON e.position_id = dp.position_id
+    WHERE
+        dp.name ILIKE ('%' || role_name || '%')
+    ORDER BY e.employee_id;
+$$;
@@ -0,0 +1,16 @@
+-- queries/candidate_detail.sql
+-- Per-TV breakdown for a single candidate (tens of rows instead of the full pool).
+-- The talent_match placeholder below is replaced with the body of talent_match.sql at load time.
+
+SELECT
+    tm.tgv_name,
+    tm.tv_name,
+    tm.baseline_score,
+    tm.user_score,
+    tm.tv_match_rate,
+    tm.tgv_match_rate
+FROM (
+{talent_match}
+) AS tm
+WHERE tm.employee_id = :employee_id
+ORDER BY tm.tgv_name, tm.tv_name;
@@ -0,0 +1,38 @@
+-- queries/ranked_employees.sql
+-- One row per candidate, ranked by final match rate, computed in Postgres, plus
+-- the pool's median match rate and candidate count on every row.
+-- The talent_match placeholder below is replaced with the body of talent_match.sql at load time.
+
+WITH candidates AS (
+    -- talent_match.sql returns one row per (employee, TV); keep one per employee
+    SELECT DISTINCT ON (tm.employee_id)
+        tm.employee_id,
+        tm.fullname,
+        tm.position,
+        tm.final_match_rate
+    FROM (
+{talent_match}
+    ) AS tm
+    ORDER BY tm.employee_id
+),
+
+-- Pool-wide figures for the Insights tab, returned with the ranking instead of
+-- running the pipeline again (PERCENTILE_CONT cannot be used as a window function)
+stats AS (
+    SELECT
+        PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY c.final_match_rate) AS median_match_rate,
+        COUNT(*) AS total_candidates
+    FROM candidates c
+)
+
+SELECT
+    ROW_NUMBER() OVER (ORDER BY c.final_match_rate DESC, c.employee_id) AS "Rank",
+    c.employee_id,
+    c.fullname,
+    c.position,
+    c.final_match_rate,
+    s.median_match_rate,
+    s.total_candidates
+FROM candidates c
+CROSS JOIN stats s
+ORDER BY "Rank";
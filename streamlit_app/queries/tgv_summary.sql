@@ -0,0 +1,12 @@
+-- queries/tgv_summary.sql
+-- Average TGV match rate across the candidate pool, aggregated in Postgres.
+-- The talent_match placeholder below is replaced with the body of talent_match.sql at load time.
+
+SELECT
+    tm.tgv_name,
+    ROUND(AVG(tm.tgv_match_rate)::NUMERIC, 2) AS tgv_match_rate
+FROM (
+{talent_match}
+) AS tm
+GROUP BY tm.tgv_name
+ORDER BY tgv_match_rate DESC;
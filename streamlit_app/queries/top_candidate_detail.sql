@@ -0,0 +1,25 @@
+-- queries/top_candidate_detail.sql
+-- Per-TV breakdown for the top-ranked candidate, chosen in Postgres so it can run
+-- alongside the ranking instead of waiting for it.
+-- The talent_match placeholder below is replaced with the body of talent_match.sql at load time.
+
+WITH tm AS (
+{talent_match}
+)
+
+SELECT
+    tm.tgv_name,
+    tm.tv_name,
+    tm.baseline_score,
+    tm.user_score,
+    tm.tv_match_rate,
+    tm.tgv_match_rate
+FROM tm
+-- Same ordering as the "Rank" column in ranked_employees.sql
+WHERE tm.employee_id = (
+    SELECT employee_id
+    FROM tm
+    ORDER BY final_match_rate DESC, employee_id
+    LIMIT 1
+)
+ORDER BY tm.tgv_name, tm.tv_name;